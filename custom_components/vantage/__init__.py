@@ -9,7 +9,7 @@ from aiovantage.errors import (
     LoginFailedError,
     LoginRequiredError,
 )
-from aiovantage.objects import Master
+from aiovantage.objects import Master, PowerProfile
 
 from homeassistant.config_entries import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.const import (
@@ -23,7 +23,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.util.ssl import get_default_no_verify_context
 
 from .config_entry import VantageConfigEntry, VantageData
-from .device import async_setup_devices
+from .device import async_cleanup_devices, async_setup_devices
 from .entity import async_cleanup_entities
 from .events import async_setup_events
 from .migrate import async_migrate_data
@@ -60,6 +60,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: VantageConfigEntry) -> b
     # Store the client in the config entry's runtime data
     entry.runtime_data = VantageData(client=vantage)
 
+    # Invalidate cached power profile lookups when a profile changes
+    def handle_power_profile_event(
+        _event: VantageEvent, obj: PowerProfile, _data: Any
+    ) -> None:
+        entry.runtime_data.dimmable_power_profiles.pop(obj.id, None)
+
+    entry.async_on_unload(
+        vantage.power_profiles.subscribe(
+            handle_power_profile_event,
+            event_filter=(VantageEvent.OBJECT_UPDATED, VantageEvent.OBJECT_DELETED),
+        )
+    )
+
     try:
         # Initialize and fetch all objects
         await vantage.initialize()
@@ -76,8 +89,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: VantageConfigEntry) -> b
         # Set up each platform (lights, covers, etc.)
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-        # Clean up any orphaned entities
-        async_cleanup_entities(hass, entry)
+        # Clean up any orphaned entities and devices, building the set of all known
+        # object IDs once rather than asking every controller for each entry
+        live_ids = {obj.id for obj in vantage}
+        async_cleanup_entities(hass, entry, live_ids)
+        async_cleanup_devices(hass, entry, live_ids)
 
         # Subscribe to system programming events
         async def handle_system_program_event(
@@ -21,7 +21,7 @@ async def async_setup_entry(
     vantage = entry.runtime_data.client
     register_items = partial(async_register_vantage_objects, entry, async_add_entities)
 
-    # Set up all cover entities
+    # Set up all dry contact entities
     register_items(vantage.dry_contacts, VantageDryContact)
 
 
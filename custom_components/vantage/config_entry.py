@@ -1,6 +1,6 @@
 """Vantage config entry."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from homeassistant.config_entries import ConfigEntry
 
@@ -14,3 +14,6 @@ class VantageData:
     """Data for a Vantage config entry."""
 
     client: Vantage
+
+    # Cache of whether each power profile (by id) is dimmable
+    dimmable_power_profiles: dict[int, bool] = field(default_factory=dict)
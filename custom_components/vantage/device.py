@@ -1,7 +1,9 @@
 """Support for Vantage devices."""
 
-from typing import Any, Protocol, TypeVar, runtime_checkable
+import asyncio
+from collections import defaultdict
 from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple, Protocol, TypeVar, cast, runtime_checkable
 
 from aiovantage import Vantage, VantageEvent
 from aiovantage.controllers import BaseController
@@ -27,6 +29,7 @@ async def async_setup_devices(hass: HomeAssistant, entry: VantageConfigEntry) ->
     """Set up Vantage devices in the device registry."""
     vantage = entry.runtime_data.client
     dev_reg = dr.async_get(hass)
+    get_or_create_device = dev_reg.async_get_or_create
 
     async def register_items(
         controller: BaseController[T],
@@ -36,11 +39,9 @@ async def async_setup_devices(hass: HomeAssistant, entry: VantageConfigEntry) ->
         async def add_device(obj: T) -> dr.DeviceEntry:
             device_info = vantage_device_info(vantage, obj)
             if extra_info_fn:
-                device_info.update(await extra_info_fn(obj))
+                device_info |= await extra_info_fn(obj)
 
-            return dev_reg.async_get_or_create(
-                config_entry_id=entry.entry_id, **device_info
-            )
+            return get_or_create_device(config_entry_id=entry.entry_id, **device_info)
 
         # Remove a device from the device registry
         def remove_device(obj: T) -> None:
@@ -56,9 +57,13 @@ async def async_setup_devices(hass: HomeAssistant, entry: VantageConfigEntry) ->
             else:
                 await add_device(obj)
 
-        # Add all current members of this controller
-        for obj in controller:
-            await add_device(obj)
+        # Add all current members of this controller, fetching any extra info
+        # for each member concurrently
+        if extra_info_fn:
+            await asyncio.gather(*(add_device(obj) for obj in controller))
+        else:
+            for obj in controller:
+                await add_device(obj)
 
         # Register a callback for new members
         entry.async_on_unload(controller.subscribe(handle_device_event))
@@ -69,18 +74,40 @@ async def async_setup_devices(hass: HomeAssistant, entry: VantageConfigEntry) ->
 
     await register_items(vantage.masters, extra_master_info)
 
-    # Register "parent" devices (controllers, modules, port devices, and stations)
+    # Register "parent" devices (controllers, modules, port devices, and stations).
+    # Masters must be registered first, since they are the "via" device for these.
     await register_items(vantage.modules)
     await register_items(vantage.port_devices)
     await register_items(vantage.stations)
 
-    # Clean up any devices for objects that no longer exist on the Vantage controller
+
+def async_cleanup_devices(
+    hass: HomeAssistant, entry: VantageConfigEntry, live_ids: set[int]
+) -> None:
+    """Remove devices from HA that are no longer in the Vantage controller."""
+    dev_reg = dr.async_get(hass)
+
+    # Index registered devices by the Vantage object ID they belong to, several
+    # devices may share the same object ID
+    devices_by_vantage_id: dict[int, list[dr.DeviceEntry]] = defaultdict(list)
     for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id):
-        # Device IDs always start with the object ID, followed by an optional suffix
         device_id = next(x[1] for x in device.identifiers if x[0] == DOMAIN)
-        vantage_id = int(device_id.split(":")[0])
-        if vantage_id not in vantage:
-            dev_reg.async_remove_device(device.id)
+        devices_by_vantage_id[vantage_id_from_identifier(device_id)].append(device)
+
+    # Clean up any devices for objects that no longer exist on the Vantage controller
+    for vantage_id, devices in devices_by_vantage_id.items():
+        if vantage_id not in live_ids:
+            for device in devices:
+                dev_reg.async_remove_device(device.id)
+
+
+def vantage_id_from_identifier(identifier: str) -> int:
+    """Get the Vantage object ID from a device identifier or entity unique ID.
+
+    Identifiers always start with the object ID, followed by an optional
+    ":suffix", for example "123" or "123:variables".
+    """
+    return int(identifier.partition(":")[0])
 
 
 @runtime_checkable
@@ -90,46 +117,79 @@ class ChildObject(Protocol):
     parent: Parent
 
 
-def vantage_device_info(client: Vantage, obj: SystemObject) -> DeviceInfo:
-    """Build the device info for a Vantage object."""
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, str(obj.id))},
-        name=obj.display_name,
-    )
+class DeviceTypeInfo(NamedTuple):
+    """Device info that is shared by all Vantage objects of the same type."""
+
+    manufacturer: str
+    model: str
+    is_master: bool
+    is_location: bool
+    is_child: bool
+    has_serial_number: bool
+
+
+# Cache of per-type device info, keyed by Vantage object class
+_DEVICE_TYPE_CACHE: dict[type[SystemObject], DeviceTypeInfo] = {}
+
+
+def vantage_device_type_info(obj: SystemObject) -> DeviceTypeInfo:
+    """Get the (cached) per-type device info for a Vantage object."""
+    if type_info := _DEVICE_TYPE_CACHE.get(type(obj)):
+        return type_info
 
     # Suggest sensible model and manufacturer names
     parts = obj.vantage_type().split(".", 1)
     if len(parts) > 1:
         # Vantage CustomDevice objects take the form "manufacturer.model"
-        device_info["manufacturer"] = parts[0]
-        device_info["model"] = parts[1]
+        manufacturer, model = parts
     else:
         # Otherwise, assume this is a built-in Vantage object
-        device_info["manufacturer"] = "Vantage"
-        device_info["model"] = parts[0]
+        manufacturer, model = "Vantage", parts[0]
+
+    type_info = _DEVICE_TYPE_CACHE[type(obj)] = DeviceTypeInfo(
+        manufacturer=manufacturer,
+        model=model,
+        is_master=isinstance(obj, Master),
+        is_location=isinstance(obj, LocationObject),
+        is_child=isinstance(obj, ChildObject),
+        has_serial_number=isinstance(obj, Master | StationObject),
+    )
+
+    return type_info
+
+
+def vantage_device_info(client: Vantage, obj: SystemObject) -> DeviceInfo:
+    """Build the device info for a Vantage object."""
+    type_info = vantage_device_type_info(obj)
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, str(obj.id))},
+        name=obj.display_name,
+        manufacturer=type_info.manufacturer,
+        model=type_info.model,
+    )
 
     # Suggest an area for LocationObject devices
     if (
-        isinstance(obj, LocationObject)
-        and obj.area
-        and (area := client.areas.get(obj.area))
+        type_info.is_location
+        and (area_id := cast(LocationObject, obj).area)
+        and (area := client.areas.get(area_id))
     ):
         device_info["suggested_area"] = area.name
 
     # Attach serial number for devices that have one
-    if isinstance(obj, Master) or isinstance(obj, StationObject):
-        if obj.serial_number:
-            device_info["serial_number"] = str(obj.serial_number)
+    if type_info.has_serial_number:
+        if serial_number := cast(Master | StationObject, obj).serial_number:
+            device_info["serial_number"] = str(serial_number)
 
     # Set up device relationships
-    if not isinstance(obj, Master):
+    if not type_info.is_master:
         if (
-            isinstance(obj, ChildObject)
-            and obj.parent.id in client
-            and not client.back_boxes.get(obj.parent.id)
+            type_info.is_child
+            and (parent_id := cast(ChildObject, obj).parent.id) in client
+            and not client.back_boxes.get(parent_id)
         ):
             # Attach the parent device for child objects (except for BackBoxes)
-            device_info["via_device"] = (DOMAIN, str(obj.parent.id))
+            device_info["via_device"] = (DOMAIN, str(parent_id))
         else:
             # Attach the master device for all other objects
             device_info["via_device"] = (DOMAIN, str(obj.master))
@@ -21,7 +21,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .config_entry import VantageConfigEntry
 from .const import DOMAIN
-from .device import vantage_device_info
+from .device import vantage_device_info, vantage_id_from_identifier
 
 # TypeVar for a SystemObject or subclass
 SystemObjectT = TypeVar("SystemObjectT", bound=SystemObject)
@@ -56,14 +56,13 @@ def async_register_vantage_objects(
     )
 
 
-def async_cleanup_entities(hass: HomeAssistant, entry: VantageConfigEntry) -> None:
+def async_cleanup_entities(
+    hass: HomeAssistant, entry: VantageConfigEntry, live_ids: set[int]
+) -> None:
     """Remove entities from HA that are no longer in the Vantage controller."""
-    vantage = entry.runtime_data.client
     ent_reg = er.async_get(hass)
     for entity in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
-        # Entity IDs always start with the object ID, followed by an optional suffix
-        vantage_id = int(entity.unique_id.split(":")[0])
-        if vantage_id not in vantage:
+        if vantage_id_from_identifier(entity.unique_id) not in live_ids:
             ent_reg.async_remove(entity.entity_id)
 
 
@@ -94,6 +93,10 @@ class VantageEntity(Generic[SystemObjectT], Entity):
     def __post_init__(self) -> None:
         """Run after entity is initialized."""
 
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update cached entity attributes from the Vantage object state."""
+
     @property
     def name(self) -> str | None:
         """Return the name of the entity."""
@@ -141,9 +144,13 @@ class VantageEntity(Generic[SystemObjectT], Entity):
             )
         )
 
+        # Snapshot the object state only once subscribed, so no updates are missed
+        self._async_update_attrs()
+
     async def async_update(self) -> None:
         """Update the state of an entity manully, typically when polling."""
         await self.async_request_call(self.obj.fetch_state())
+        self._async_update_attrs()
 
     @callback
     def _handle_event(
@@ -171,8 +178,11 @@ class VantageEntity(Generic[SystemObjectT], Entity):
                         **vantage_device_info(self.client, obj),
                     )
 
-        # Object state is kept up to date by the Vantage client by an internal
-        # subscription.  We just need to tell HA the state has changed.
+            # Object state is kept up to date by the Vantage client by an internal
+            # subscription.  We just need to refresh any cached attributes.
+            self._async_update_attrs()
+
+        # Tell HA the state has changed
         self.async_write_ha_state()
 
 
@@ -20,6 +20,7 @@ from .const import (
 def async_setup_events(hass: HomeAssistant, entry: VantageConfigEntry) -> None:
     """Set up Vantage events from a config entry."""
     vantage = entry.runtime_data.client
+    get_station = vantage.stations.get
 
     def handle_button_event(_event: VantageEvent, obj: Button, data: Any) -> None:
         """Handle button press/release events."""
@@ -34,7 +35,7 @@ def async_setup_events(hass: HomeAssistant, entry: VantageConfigEntry) -> None:
             "button_text2": obj.text2,
         }
 
-        if station := vantage.stations.get(obj.parent.id):
+        if station := get_station(obj.parent.id):
             payload["station_id"] = station.id
             payload["station_name"] = station.name
 
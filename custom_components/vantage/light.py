@@ -1,10 +1,12 @@
 """Support for Vantage light entities."""
 
-import functools
-from typing import Any, TypeVar, cast
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
 
-from aiovantage.objects import Load, LoadGroup
+from aiovantage.controllers import BaseController
 from aiovantage.controllers.rgb_loads import RGBLoadTypes
+from aiovantage.objects import Load, LoadGroup
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -17,22 +19,28 @@ from homeassistant.components.light import (
     LightEntity,
     LightEntityFeature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.color import brightness_to_value, value_to_brightness
+from homeassistant.util.color import brightness_to_value
 
 from .config_entry import VantageConfigEntry
 from .const import LOGGER
 from .entity import VantageEntity, async_register_vantage_objects
 
-# TypeVar for RGB/RGBW color tuples
-ColorT = TypeVar("ColorT", tuple[int, int, int], tuple[int, int, int, int])
-
 # Vantage level range for converting between HA brightness and Vantage levels
 LEVEL_RANGE = (1, 100)
 
+# Map Vantage RGB load color types to HA color modes, and whether they support
+# transitions
+COLOR_TYPE_MODES: dict[str, tuple[ColorMode, bool]] = {
+    "HSL": (ColorMode.HS, True),
+    "RGB": (ColorMode.RGB, True),
+    "RGBW": (ColorMode.RGBW, False),
+    "CCT": (ColorMode.COLOR_TEMP, True),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,9 +49,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up Vantage light entities from config entry."""
     vantage = entry.runtime_data.client
-    register_items = functools.partial(
-        async_register_vantage_objects, entry, async_add_entities
-    )
+
+    def register_items(
+        controller: BaseController[Any],
+        entity_class: type[VantageEntity[Any]],
+        object_filter: Callable[[Any], bool] | None = None,
+    ) -> None:
+        async_register_vantage_objects(
+            entry, async_add_entities, controller, entity_class, object_filter
+        )
 
     # Set up all light-type objects
     def load_filter(obj: Load) -> bool:
@@ -59,13 +73,22 @@ class VantageLight(VantageEntity[Load], LightEntity):
 
     def __post_init__(self) -> None:
         """Initialize the light."""
-        # Look up the power profile for this load to determine if it is dimmable
-        power_profile = self.client.power_profiles.get(self.obj.power_profile)
+        # Look up the power profile for this load to determine if it is dimmable,
+        # many loads share the same power profile so cache the result
+        dimmable_profiles = self.config_entry.runtime_data.dimmable_power_profiles
+        is_dimmable = dimmable_profiles.get(self.obj.power_profile)
+        if is_dimmable is None:
+            power_profile = self.client.power_profiles.get(self.obj.power_profile)
+            is_dimmable = bool(power_profile and power_profile.is_dimmable)
+
+            # Only cache profiles that exist, a missing profile may be added later
+            if power_profile:
+                dimmable_profiles[self.obj.power_profile] = is_dimmable
 
         # Set up the light based on the power profile
         self._attr_supported_color_modes: set[str] = set()
 
-        if power_profile and power_profile.is_dimmable:
+        if is_dimmable:
             self._attr_supported_color_modes.add(ColorMode.BRIGHTNESS)
             self._attr_color_mode = ColorMode.BRIGHTNESS
             self._attr_supported_features |= LightEntityFeature.TRANSITION
@@ -73,23 +96,18 @@ class VantageLight(VantageEntity[Load], LightEntity):
             self._attr_supported_color_modes.add(ColorMode.ONOFF)
             self._attr_color_mode = ColorMode.ONOFF
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if entity is on."""
-        return self.obj.is_on
-
-    @property
-    def brightness(self) -> int | None:
-        """Return the brightness of this light between 0..255."""
-        if self.obj.level is None:
-            return None
-
-        return value_to_brightness(LEVEL_RANGE, float(self.obj.level))
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update cached entity attributes from the Vantage object state."""
+        self._attr_is_on = self.obj.is_on
+        self._attr_brightness = (
+            None if self.obj.level is None else level_to_brightness(self.obj.level)
+        )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
         transition = kwargs.get(ATTR_TRANSITION, 0)
-        level = brightness_to_value(LEVEL_RANGE, kwargs.get(ATTR_BRIGHTNESS, 255))
+        level = brightness_to_level(kwargs.get(ATTR_BRIGHTNESS))
 
         await self.async_request_call(self.obj.turn_on(transition, level))
 
@@ -105,74 +123,39 @@ class VantageRGBLight(VantageEntity[RGBLoadTypes], LightEntity):
 
     def __post_init__(self) -> None:
         """Initialize the light."""
-        # Set up the light based on the color type
-        self._attr_supported_color_modes: set[str] = set()
-
-        match self.obj.color_type:
-            case self.obj.ColorType.HSL:
-                self._attr_supported_color_modes.add(ColorMode.HS)
-                self._attr_color_mode = ColorMode.HS
-                self._attr_supported_features |= LightEntityFeature.TRANSITION
-            case self.obj.ColorType.RGB:
-                self._attr_supported_color_modes.add(ColorMode.RGB)
-                self._attr_color_mode = ColorMode.RGB
-                self._attr_supported_features |= LightEntityFeature.TRANSITION
-            case self.obj.ColorType.RGBW:
-                self._attr_supported_color_modes.add(ColorMode.RGBW)
-                self._attr_color_mode = ColorMode.RGBW
-            case self.obj.ColorType.CCT:
-                self._attr_supported_color_modes.add(ColorMode.COLOR_TEMP)
-                self._attr_color_mode = ColorMode.COLOR_TEMP
-                self._attr_min_color_temp_kelvin = self.obj.min_temp
-                self._attr_max_color_temp_kelvin = self.obj.max_temp
-                self._attr_supported_features |= LightEntityFeature.TRANSITION
-            case _:
-                # Treat all other color types as dimmable non-color lights
-                self._attr_supported_color_modes.add(ColorMode.BRIGHTNESS)
-                self._attr_color_mode = ColorMode.BRIGHTNESS
-                self._attr_supported_features |= LightEntityFeature.TRANSITION
-
-                LOGGER.warning(
-                    "Unsupported color type %s for RGB light %s",
-                    self.obj.color_type,
-                    self.obj.name,
-                )
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if entity is on."""
-        return self.obj.is_on
-
-    @property
-    def brightness(self) -> int | None:
-        """Return the brightness of this light between 0..255."""
-        if self.obj.level is None:
-            return None
-
-        return value_to_brightness(LEVEL_RANGE, float(self.obj.level))
-
-    @property
-    def hs_color(self) -> tuple[float, float] | None:
-        """Return the hue and saturation color value [float, float]."""
-        if self.obj.hsl is None:
-            return None
-
-        return self.obj.hsl[:2]
+        # Set up the light based on the color type, treating all unsupported color
+        # types as dimmable non-color lights
+        if mode_info := COLOR_TYPE_MODES.get(self.obj.color_type.name):
+            color_mode, supports_transition = mode_info
+        else:
+            color_mode, supports_transition = ColorMode.BRIGHTNESS, True
 
-    @property
-    def rgb_color(self) -> tuple[int, int, int] | None:
-        """Return the rgb color value [int, int, int]."""
-        return self.obj.rgb
+            LOGGER.warning(
+                "Unsupported color type %s for RGB light %s",
+                self.obj.color_type,
+                self.obj.name,
+            )
 
-    @property
-    def rgbw_color(self) -> tuple[int, int, int, int] | None:
-        """Return the rgbw color value [int, int, int, int]."""
-        return self.obj.rgbw
+        self._attr_supported_color_modes = {color_mode}
+        self._attr_color_mode = color_mode
+        if supports_transition:
+            self._attr_supported_features |= LightEntityFeature.TRANSITION
 
-    @property
-    def color_temp_kelvin(self) -> int | None:
-        """Return the CT color value in Kelvin."""
-        return self.obj.color_temp
+        if color_mode == ColorMode.COLOR_TEMP:
+            self._attr_min_color_temp_kelvin = self.obj.min_temp
+            self._attr_max_color_temp_kelvin = self.obj.max_temp
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update cached entity attributes from the Vantage object state."""
+        self._attr_is_on = self.obj.is_on
+        self._attr_brightness = (
+            None if self.obj.level is None else level_to_brightness(self.obj.level)
+        )
+        self._attr_hs_color = None if self.obj.hsl is None else self.obj.hsl[:2]
+        self._attr_rgb_color = self.obj.rgb
+        self._attr_rgbw_color = self.obj.rgbw
+        self._attr_color_temp_kelvin = self.obj.color_temp
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
@@ -181,8 +164,8 @@ class VantageRGBLight(VantageEntity[RGBLoadTypes], LightEntity):
             rgbw: tuple[int, int, int, int] = kwargs[ATTR_RGBW_COLOR]
 
             # Scale the brightness of the color if provided
-            if brightness := kwargs.get(ATTR_BRIGHTNESS) is not None:
-                rgbw = scale_color_brightness(rgbw, brightness)
+            if (brightness := kwargs.get(ATTR_BRIGHTNESS)) is not None:
+                rgbw = scale_rgbw_brightness(rgbw, brightness)
 
             await self.async_request_call(self.obj.set_rgbw(*rgbw))
 
@@ -192,8 +175,8 @@ class VantageRGBLight(VantageEntity[RGBLoadTypes], LightEntity):
             transition = kwargs.get(ATTR_TRANSITION, 0)
 
             # Scale the brightness of the color if provided
-            if brightness := kwargs.get(ATTR_BRIGHTNESS) is not None:
-                rgb = scale_color_brightness(rgb, brightness)
+            if (brightness := kwargs.get(ATTR_BRIGHTNESS)) is not None:
+                rgb = scale_rgb_brightness(rgb, brightness)
 
             await self.async_request_call(self.obj.dissolve_rgb(*rgb, transition))
 
@@ -201,7 +184,7 @@ class VantageRGBLight(VantageEntity[RGBLoadTypes], LightEntity):
             # Turn on the light with the provided HS color and brightness, default to
             # 100% brightness if not provided
             hue, saturation = kwargs[ATTR_HS_COLOR]
-            level = brightness_to_value(LEVEL_RANGE, kwargs.get(ATTR_BRIGHTNESS, 255))
+            level = brightness_to_level(kwargs.get(ATTR_BRIGHTNESS))
             transition = kwargs.get(ATTR_TRANSITION, 0)
 
             await self.async_request_call(
@@ -217,7 +200,7 @@ class VantageRGBLight(VantageEntity[RGBLoadTypes], LightEntity):
 
             # Turn on the light with the provided brightness, default to 100%
             transition = kwargs.get(ATTR_TRANSITION, 0)
-            level = brightness_to_value(LEVEL_RANGE, kwargs.get(ATTR_BRIGHTNESS, 255))
+            level = brightness_to_level(kwargs.get(ATTR_BRIGHTNESS))
 
             await self.async_request_call(self.obj.turn_on(transition, level))
 
@@ -249,23 +232,18 @@ class VantageLightGroup(VantageEntity[LoadGroup], LightEntity):
 
         return device_info
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if entity is on."""
-        return self.obj.is_on
-
-    @property
-    def brightness(self) -> int | None:
-        """Return the brightness of this light between 0..255."""
-        if self.obj.level is None:
-            return None
-
-        return value_to_brightness(LEVEL_RANGE, float(self.obj.level))
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update cached entity attributes from the Vantage object state."""
+        self._attr_is_on = self.obj.is_on
+        self._attr_brightness = (
+            None if self.obj.level is None else level_to_brightness(self.obj.level)
+        )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
         transition = kwargs.get(ATTR_TRANSITION, 0)
-        level = brightness_to_value(LEVEL_RANGE, kwargs.get(ATTR_BRIGHTNESS, 255))
+        level = brightness_to_level(kwargs.get(ATTR_BRIGHTNESS))
 
         await self.async_request_call(self.obj.turn_on(transition, level))
 
@@ -276,9 +254,47 @@ class VantageLightGroup(VantageEntity[LoadGroup], LightEntity):
         await self.async_request_call(self.obj.turn_off(transition))
 
 
-def scale_color_brightness(color: ColorT, brightness: int | None) -> ColorT:
-    """Scale the brightness of an RGB/RGBW color tuple."""
+def level_to_brightness(level: Decimal) -> int:
+    """Convert a Vantage level (0-100) to a HA brightness (1-255).
+
+    Equivalent to value_to_brightness(LEVEL_RANGE, float(level)), without the
+    float conversion and range unpacking.
+    """
+    return min(255, max(1, round(level * 255 / 100)))
+
+
+def brightness_to_level(brightness: int | None) -> float:
+    """Convert a HA brightness (1-255) to a Vantage level, defaulting to 100%."""
     if brightness is None:
-        return color
+        return LEVEL_RANGE[1]
+
+    return brightness_to_value(LEVEL_RANGE, brightness)
+
+
+def scale_rgb_brightness(
+    color: tuple[int, int, int], brightness: int
+) -> tuple[int, int, int]:
+    """Scale the brightness of an RGB color tuple."""
+    r, g, b = color
 
-    return cast(ColorT, tuple(int(round(c * brightness / 255)) for c in color))
+    # Round to the nearest integer using integer arithmetic only
+    return (
+        (r * brightness + 127) // 255,
+        (g * brightness + 127) // 255,
+        (b * brightness + 127) // 255,
+    )
+
+
+def scale_rgbw_brightness(
+    color: tuple[int, int, int, int], brightness: int
+) -> tuple[int, int, int, int]:
+    """Scale the brightness of an RGBW color tuple."""
+    r, g, b, w = color
+
+    # Round to the nearest integer using integer arithmetic only
+    return (
+        (r * brightness + 127) // 255,
+        (g * brightness + 127) // 255,
+        (b * brightness + 127) // 255,
+        (w * brightness + 127) // 255,
+    )
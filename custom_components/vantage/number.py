@@ -1,7 +1,9 @@
 """Support for Vantage number entities."""
 
-import functools
+from collections.abc import Callable
+from typing import Any
 
+from aiovantage.controllers import BaseController
 from aiovantage.objects import GMem
 
 from homeassistant.components.number import NumberDeviceClass, NumberEntity
@@ -11,7 +13,72 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .config_entry import VantageConfigEntry
 from .const import LOGGER
-from .entity import VantageVariableEntity, async_register_vantage_objects
+from .entity import (
+    VantageEntity,
+    VantageVariableEntity,
+    async_register_vantage_objects,
+)
+
+# Entity attributes for each Vantage variable tag type
+TAG_TYPE_ATTRS: dict[str, dict[str, Any]] = {
+    # Generic fixed-precision unsigned measurement unit
+    "DeviceUnits": {
+        "_attr_native_min_value": 0,
+        "_attr_native_max_value": 604800.0,
+    },
+    # A percentage
+    "Level": {
+        "_attr_native_min_value": 0,
+        "_attr_native_max_value": 100.0,
+        "_attr_native_unit_of_measurement": PERCENTAGE,
+    },
+    # Integer "pointer" to another object, via id
+    "Load": {
+        "_attr_native_min_value": 1,
+        "_attr_native_max_value": 10000,
+    },
+    "Task": {
+        "_attr_native_min_value": 1,
+        "_attr_native_max_value": 10000,
+    },
+    # Generic 32-bit signed integer
+    "Number": {
+        "_attr_native_min_value": -(2**31),
+        "_attr_native_max_value": 2**31 - 1,
+    },
+    # Up to 24 hour delay, with millisecond precision
+    "Delay": {
+        "_attr_native_unit_of_measurement": UnitOfTime.MILLISECONDS,
+        "_attr_native_min_value": 0,
+        "_attr_native_max_value": 24 * 60 * 60 * 1000,
+    },
+    # Number of seconds, up to 7 days, with millisecond precision
+    "Seconds": {
+        "_attr_native_unit_of_measurement": UnitOfTime.SECONDS,
+        "_attr_native_min_value": 0.0,
+        "_attr_native_max_value": 7 * 24 * 60 * 60,
+    },
+    # Temperature in degrees Celsius
+    "DegC": {
+        "_attr_native_min_value": -40,
+        "_attr_native_max_value": 150,
+        "_attr_device_class": NumberDeviceClass.TEMPERATURE,
+        "_attr_native_unit_of_measurement": UnitOfTemperature.CELSIUS,
+    },
+    "Footcandles": {
+        "_attr_native_min_value": 0,
+        "_attr_native_max_value": 2**31,
+        "_attr_native_step": 0.001 * 10.7639104167,  # units: footcandles to lux
+        "_attr_device_class": NumberDeviceClass.ILLUMINANCE,
+        "_attr_native_unit_of_measurement": LIGHT_LUX,
+    },
+    # Generic signed decimal
+    "Decimal": {
+        "_attr_native_min_value": -(2**31),
+        "_attr_native_max_value": 2**31,
+        "_attr_native_step": 0.001,
+    },
+}
 
 
 async def async_setup_entry(
@@ -21,9 +88,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up Vantage number entities from config entry."""
     vantage = entry.runtime_data.client
-    register_items = functools.partial(
-        async_register_vantage_objects, entry, async_add_entities
-    )
+
+    def register_items(
+        controller: BaseController[Any],
+        entity_class: type[VantageEntity[Any]],
+        object_filter: Callable[[Any], bool] | None = None,
+    ) -> None:
+        async_register_vantage_objects(
+            entry, async_add_entities, controller, entity_class, object_filter
+        )
 
     # Register all number entities
     def gmem_filter(obj: GMem) -> bool:
@@ -37,57 +110,14 @@ class VantageNumberVariable(VantageVariableEntity, NumberEntity):
 
     def __post_init__(self) -> None:
         """Initialize a Vantage number variable."""
-        match self.obj.tag.type:
-            case "DeviceUnits":
-                # Generic fixed-precision unsigned measurement unit
-                self._attr_native_min_value = 0
-                self._attr_native_max_value = 604800.0
-            case "Level":
-                # A percentage
-                self._attr_native_min_value = 0
-                self._attr_native_max_value = 100.0
-                self._attr_native_unit_of_measurement = PERCENTAGE
-            case "Load" | "Task":
-                # Integer "pointer" to another object, via id
-                self._attr_native_min_value = 1
-                self._attr_native_max_value = 10000
-            case "Number":
-                # Generic 32-bit signed integer
-                self._attr_native_min_value = -(2**31)
-                self._attr_native_max_value = 2**31 - 1
-            case "Delay":
-                # Up to 24 hour delay, with millisecond precision
-                self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
-                self._attr_native_min_value = 0
-                self._attr_native_max_value = 24 * 60 * 60 * 1000
-            case "Seconds":
-                # Number of seconds, up to 7 days, with millisecond precision
-                self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
-                self._attr_native_min_value = 0.0
-                self._attr_native_max_value = 7 * 24 * 60 * 60
-            case "DegC":
-                # Temperature in degrees Celsius
-                self._attr_native_min_value = -40
-                self._attr_native_max_value = 150
-                self._attr_device_class = NumberDeviceClass.TEMPERATURE
-                self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-            case "Footcandles":
-                self._attr_native_min_value = 0
-                self._attr_native_max_value = 2**31
-                self._attr_native_step = (
-                    0.001 * 10.7639104167
-                )  # units: footcandles to lux
-                self._attr_device_class = NumberDeviceClass.ILLUMINANCE
-                self._attr_native_unit_of_measurement = LIGHT_LUX
-            case "Decimal":
-                # Generic signed decimal
-                self._attr_native_min_value = -(2**31)
-                self._attr_native_max_value = 2**31
-                self._attr_native_step = 0.001
-            case _:
-                LOGGER.warning(
-                    "Unknown number type %s: %s", self.obj.tag.type, self.obj
-                )
+        if (attrs := TAG_TYPE_ATTRS.get(self.obj.tag.type)) is None:
+            LOGGER.warning("Unknown number type %s: %s", self.obj.tag.type, self.obj)
+            return
+
+        # Assign via setattr rather than __dict__.update(), so that HA's cached
+        # entity properties are invalidated
+        for attr, value in attrs.items():
+            setattr(self, attr, value)
 
     @property
     def native_value(self) -> float | None:
@@ -1,8 +1,9 @@
 """Support for Vantage switch entities."""
 
-import functools
+from collections.abc import Callable
 from typing import Any
 
+from aiovantage.controllers import BaseController
 from aiovantage.objects import GMem, Load
 
 from homeassistant.components.switch import SwitchEntity
@@ -20,9 +21,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up Vantage switch entities from config entry."""
     vantage = entry.runtime_data.client
-    register_items = functools.partial(
-        async_register_vantage_objects, entry, async_add_entities
-    )
+
+    def register_items(
+        controller: BaseController[Any],
+        entity_class: type[VantageEntity[Any]],
+        object_filter: Callable[[Any], bool] | None = None,
+    ) -> None:
+        async_register_vantage_objects(
+            entry, async_add_entities, controller, entity_class, object_filter
+        )
 
     # Register Load switch entities
     def load_filter(obj: Load) -> bool: